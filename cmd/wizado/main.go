@@ -18,6 +18,7 @@ import (
 	"github.com/wattfource/wizado/internal/sysinfo"
 	"github.com/wattfource/wizado/internal/telemetry"
 	"github.com/wattfource/wizado/internal/tui"
+	"github.com/wattfource/wizado/internal/waybar"
 )
 
 // Version is set at build time
@@ -283,18 +284,20 @@ func runRemove(cmd *cobra.Command, args []string) {
 		}
 		
 		content := string(data)
-		if !strings.Contains(content, "# Wizado - added by wizado") {
-			continue
-		}
-		
-		// Remove wizado bindings block
+
+		// Remove wizado bindings block. One Index call both tests for
+		// and locates the marker; the end marker is searched only past
+		// startIdx so the prefix is not rescanned.
 		startMarker := "# Wizado - added by wizado"
 		endMarker := "# End Wizado bindings"
-		
+
 		startIdx := strings.Index(content, startMarker)
-		endIdx := strings.Index(content, endMarker)
-		
-		if startIdx != -1 && endIdx != -1 {
+		if startIdx == -1 {
+			continue
+		}
+
+		if endIdx := strings.Index(content[startIdx:], endMarker); endIdx != -1 {
+			endIdx += startIdx
 			// Include a newline before the block
 			if startIdx > 0 && content[startIdx-1] == '\n' {
 				startIdx--
@@ -306,9 +309,19 @@ func runRemove(cmd *cobra.Command, args []string) {
 		}
 	}
 	
+	// Remove wizado module from waybar config
+	if configPath, err := waybar.FindConfig(home); err == nil {
+		if removed, err := waybar.Remove(configPath); err != nil {
+			fmt.Printf("Warning: could not remove waybar module: %v\n", err)
+		} else if removed {
+			fmt.Printf("Removed waybar module from: %s\n", configPath)
+			waybar.Restart()
+		}
+	}
+
 	// Reload Hyprland
 	exec.Command("hyprctl", "reload").Run()
-	
+
 	fmt.Println("Wizado removed successfully")
 }
 
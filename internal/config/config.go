@@ -134,33 +134,43 @@ WIZADO_WORKSPACE=%d
 	return os.WriteFile(configFile, []byte(content), 0644)
 }
 
-// FSRScales returns the scaling factor for each FSR mode
-func FSRScales() map[string]float64 {
-	return map[string]float64{
+// Option tables are built once at package scope; callers treat them as
+// read-only, so the accessor calls below no longer allocate.
+var (
+	fsrScales = map[string]float64{
 		"ultra":       0.77,
 		"quality":     0.67,
 		"balanced":    0.59,
 		"performance": 0.5,
 	}
+	fsrOptions        = []string{"off", "ultra", "quality", "balanced", "performance"}
+	frameLimitOptions = []int{0, 30, 60, 90, 120, 144, 165, 240}
+	steamUIOptions    = []string{"gamepadui", "tenfoot"}
+	workspaceOptions  = []int{1, 2, 3, 4, 5, 6, 7, 8, 9, 10}
+)
+
+// FSRScales returns the scaling factor for each FSR mode
+func FSRScales() map[string]float64 {
+	return fsrScales
 }
 
 // FSROptions returns available FSR options
 func FSROptions() []string {
-	return []string{"off", "ultra", "quality", "balanced", "performance"}
+	return fsrOptions
 }
 
 // FrameLimitOptions returns available frame limit options
 func FrameLimitOptions() []int {
-	return []int{0, 30, 60, 90, 120, 144, 165, 240}
+	return frameLimitOptions
 }
 
 // SteamUIOptions returns available Steam UI options
 func SteamUIOptions() []string {
-	return []string{"gamepadui", "tenfoot"}
+	return steamUIOptions
 }
 
 // WorkspaceOptions returns available workspace options
 func WorkspaceOptions() []int {
-	return []int{1, 2, 3, 4, 5, 6, 7, 8, 9, 10}
+	return workspaceOptions
 }
 
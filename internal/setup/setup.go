@@ -3,7 +3,6 @@ package setup
 
 import (
 	"bufio"
-	"encoding/json"
 	"fmt"
 	"net/http"
 	"os"
@@ -14,6 +13,7 @@ import (
 
 	"github.com/wattfource/wizado/internal/logging"
 	"github.com/wattfource/wizado/internal/sysinfo"
+	"github.com/wattfource/wizado/internal/waybar"
 )
 
 // GPUInfo holds detected GPU information
@@ -45,9 +45,12 @@ func Run(opts Options) error {
 	fmt.Println()
 	
 	log.Info("Starting wizado setup")
-	
+
+	// Resolve the home directory once for every helper that needs it
+	home, _ := os.UserHomeDir()
+
 	// Validate environment first
-	if err := validateEnvironment(); err != nil {
+	if err := validateEnvironment(home); err != nil {
 		log.Errorf("Environment validation failed: %v", err)
 		return err
 	}
@@ -122,12 +125,12 @@ func Run(opts Options) error {
 	}
 	
 	// Configure Hyprland keybindings
-	if err := configureKeybindings(opts); err != nil {
+	if err := configureKeybindings(opts, home); err != nil {
 		return err
 	}
-	
+
 	// Configure Waybar
-	if err := configureWaybar(opts); err != nil {
+	if err := configureWaybar(opts, home); err != nil {
 		// Non-fatal
 		fmt.Printf("Warning: could not configure waybar: %v\n", err)
 		log.Warnf("Waybar config failed: %v", err)
@@ -268,19 +271,18 @@ func truncate(s string, max int) string {
 	return s[:max-3] + "..."
 }
 
-func validateEnvironment() error {
+func validateEnvironment(home string) error {
 	// Check for pacman
 	if _, err := exec.LookPath("pacman"); err != nil {
 		return fmt.Errorf("pacman not found - this tool is for Arch Linux")
 	}
-	
+
 	// Check for hyprctl
 	if _, err := exec.LookPath("hyprctl"); err != nil {
 		return fmt.Errorf("hyprctl not found - is Hyprland installed?")
 	}
-	
+
 	// Check for Hyprland config
-	home, _ := os.UserHomeDir()
 	hyprDir := filepath.Join(home, ".config", "hypr")
 	if _, err := os.Stat(hyprDir); os.IsNotExist(err) {
 		return fmt.Errorf("Hyprland config directory not found: %s", hyprDir)
@@ -579,9 +581,7 @@ func grantGamescopeCap(opts Options) error {
 	return cmd.Run()
 }
 
-func configureKeybindings(opts Options) error {
-	home, _ := os.UserHomeDir()
-	
+func configureKeybindings(opts Options, home string) error {
 	// Find bindings config
 	bindingsPaths := []string{
 		filepath.Join(home, ".config", "hypr", "bindings.conf"),
@@ -616,17 +616,15 @@ func configureKeybindings(opts Options) error {
 	
 	content := string(data)
 	
-	// Remove old wizado bindings
-	if strings.Contains(content, "# Wizado - added by wizado") {
-		// Find and remove the block
-		startMarker := "# Wizado - added by wizado"
-		endMarker := "# End Wizado bindings"
-		
-		startIdx := strings.Index(content, startMarker)
-		endIdx := strings.Index(content, endMarker)
-		
-		if startIdx != -1 && endIdx != -1 {
-			content = content[:startIdx] + content[endIdx+len(endMarker):]
+	// Remove old wizado bindings. A single Index both tests for and
+	// locates the marker; searching for the end marker from startIdx
+	// avoids rescanning the prefix.
+	startMarker := "# Wizado - added by wizado"
+	endMarker := "# End Wizado bindings"
+
+	if startIdx := strings.Index(content, startMarker); startIdx != -1 {
+		if endIdx := strings.Index(content[startIdx:], endMarker); endIdx != -1 {
+			content = content[:startIdx] + content[startIdx+endIdx+len(endMarker):]
 		}
 	}
 	
@@ -636,25 +634,21 @@ func configureKeybindings(opts Options) error {
 		bindStyle = "bind"
 	}
 	
-	// Add new bindings
-	bindings := fmt.Sprintf(`
-
-# Wizado - added by wizado
-# Opens Wizado TUI menu on workspace 10
-`)
-	
+	// Add new bindings, assembled in a single expression instead of a
+	// no-arg Sprintf followed by += appends
+	var binds string
 	if bindStyle == "bindd" {
-		bindings += `bindd = SUPER SHIFT, S, Wizado Menu, exec, wizado-menu-float
+		binds = `bindd = SUPER SHIFT, S, Wizado Menu, exec, wizado-menu-float
 bindd = SUPER SHIFT, Q, Kill Steam, exec, pkill -9 steam; pkill -9 gamescope
 `
 	} else {
-		bindings += `bind = SUPER SHIFT, S, exec, wizado-menu-float
+		binds = `bind = SUPER SHIFT, S, exec, wizado-menu-float
 bind = SUPER SHIFT, Q, exec, pkill -9 steam; pkill -9 gamescope
 `
 	}
-	bindings += "# End Wizado bindings\n"
-	
-	content += bindings
+
+	content += "\n\n# Wizado - added by wizado\n# Opens Wizado TUI menu on workspace 10\n" +
+		binds + "# End Wizado bindings\n"
 	
 	// Write back
 	if err := os.WriteFile(bindingsFile, []byte(content), 0644); err != nil {
@@ -669,109 +663,51 @@ bind = SUPER SHIFT, Q, exec, pkill -9 steam; pkill -9 gamescope
 	return nil
 }
 
-func configureWaybar(opts Options) error {
-	home, _ := os.UserHomeDir()
-	waybarDir := filepath.Join(home, ".config", "waybar")
-	
-	// Find waybar config
-	configPath := filepath.Join(waybarDir, "config.jsonc")
-	if _, err := os.Stat(configPath); os.IsNotExist(err) {
-		configPath = filepath.Join(waybarDir, "config")
-		if _, err := os.Stat(configPath); os.IsNotExist(err) {
-			return fmt.Errorf("waybar config not found")
-		}
+func configureWaybar(opts Options, home string) error {
+	configPath, err := waybar.FindConfig(home)
+	if err != nil {
+		return err
 	}
-	
+
 	fmt.Printf("Using waybar config: %s\n", configPath)
-	
+
 	if opts.DryRun {
 		fmt.Println("[DRY RUN] Would configure wizado module in waybar")
 		return nil
 	}
-	
-	// Read config
-	data, err := os.ReadFile(configPath)
+
+	moduleExists, changed, err := waybar.Configure(configPath)
 	if err != nil {
-		return err
-	}
-	
-	content := string(data)
-	moduleExists := strings.Contains(content, `"custom/wizado"`)
-	
-	// Module definition - on-click uses wizado-menu-float to spawn a terminal for the TUI
-	moduleJSON := `{
-    "custom/wizado": {
-        "format": "{}",
-        "return-type": "json",
-        "exec": "wizado status",
-        "on-click": "wizado-menu-float",
-        "on-click-right": "wizado-menu-float",
-        "interval": 60,
-        "tooltip": true
-    }
-}`
-	
-	// Try jq approach for both adding and updating
-	if _, err := exec.LookPath("jq"); err == nil {
-		var out []byte
-		var cmdErr error
-		
+		// Fallback: print instructions
 		if moduleExists {
-			// Update existing module with correct on-click handlers
-			cmd := exec.Command("jq", `.["custom/wizado"]["on-click"] = "wizado-menu-float" | .["custom/wizado"]["on-click-right"] = "wizado-menu-float"`, configPath)
-			out, cmdErr = cmd.Output()
+			fmt.Println("Could not automatically update waybar module.")
+			fmt.Println("Please update your custom/wizado module to use:")
+			fmt.Println(`    "on-click": "wizado-menu-float",`)
+			fmt.Println(`    "on-click-right": "wizado-menu-float",`)
 		} else {
-			// Add new module to modules-right first
-		cmd := exec.Command("jq", `if .["modules-right"] then .["modules-right"] = ["custom/wizado"] + .["modules-right"] else . end`, configPath)
-			out, cmdErr = cmd.Output()
-		}
-		
-		if cmdErr == nil {
-			var config map[string]interface{}
-			if err := json.Unmarshal(out, &config); err == nil {
-				// Always set/update the module definition with correct values
-				config["custom/wizado"] = map[string]interface{}{
-					"format":         "{}",
-					"return-type":    "json",
-					"exec":           "wizado status",
-					"on-click":       "wizado-menu-float",
-					"on-click-right": "wizado-menu-float",
-					"interval":       60,
-					"tooltip":        true,
-				}
-				
-				newData, err := json.MarshalIndent(config, "", "  ")
-				if err == nil {
-					os.WriteFile(configPath, newData, 0644)
-					if moduleExists {
-						fmt.Println("✓ Updated wizado module in waybar config")
-					} else {
-					fmt.Println("✓ Added wizado module to waybar config")
-					}
-					
-					// Restart waybar
-					exec.Command("pkill", "waybar").Run()
-					go exec.Command("waybar").Start()
-					
-					log.Info("Waybar module configured")
-					return nil
-				}
-			}
+			fmt.Println("Could not automatically add waybar module.")
+			fmt.Println("Add the following to your waybar config:")
+			fmt.Println(waybar.ModuleJSON)
 		}
+		return nil
 	}
-	
-	// Fallback: print instructions
+
+	if !changed {
+		// Nothing written, so no waybar restart needed either
+		fmt.Println("✓ Waybar module already configured")
+		log.Info("Waybar module already configured")
+		return nil
+	}
+
 	if moduleExists {
-		fmt.Println("Could not automatically update waybar module.")
-		fmt.Println("Please update your custom/wizado module to use:")
-		fmt.Println(`    "on-click": "wizado-menu-float",`)
-		fmt.Println(`    "on-click-right": "wizado-menu-float",`)
+		fmt.Println("✓ Updated wizado module in waybar config")
 	} else {
-	fmt.Println("Could not automatically add waybar module.")
-	fmt.Println("Add the following to your waybar config:")
-	fmt.Println(moduleJSON)
+		fmt.Println("✓ Added wizado module to waybar config")
 	}
-	
+
+	waybar.Restart()
+
+	log.Info("Waybar module configured")
 	return nil
 }
 
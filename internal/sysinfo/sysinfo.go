@@ -759,18 +759,14 @@ func getHyprlandInfo() PackageInfo {
 	return info
 }
 
+// versionRE matches common version patterns: "vX.Y.Z", "X.Y.Z", "version X.Y.Z".
+// Compiled once at package scope; extractVersion runs for every probed dependency.
+var versionRE = regexp.MustCompile(`v?(\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9]+)?)`)
+
 // extractVersion extracts a version number from command output
 func extractVersion(output string) string {
-	// Common patterns: "vX.Y.Z", "X.Y.Z", "version X.Y.Z"
-	patterns := []string{
-		`v?(\d+\.\d+(?:\.\d+)?(?:-[a-zA-Z0-9]+)?)`,
-	}
-
-	for _, pattern := range patterns {
-		re := regexp.MustCompile(pattern)
-		if match := re.FindStringSubmatch(output); len(match) > 1 {
-			return match[1]
-		}
+	if match := versionRE.FindStringSubmatch(output); len(match) > 1 {
+		return match[1]
 	}
 
 	// Just return first line if no pattern matches
@@ -116,23 +116,34 @@ func DefaultConfig() Config {
 
 var (
 	defaultStore *Store
+	defaultCfg   *Config
 	once         sync.Once
 )
 
-// Init initializes the telemetry store
+// Init records cfg as the configuration for the default store. Store
+// construction (data-directory creation, machine-hash derivation) is
+// deferred to the first Default call, so commands that never record
+// anything - notably `wizado status`, which waybar polls every minute -
+// skip that work entirely.
 func Init(cfg Config) error {
-	var initErr error
-	once.Do(func() {
-		defaultStore, initErr = NewStore(cfg)
-	})
-	return initErr
+	defaultCfg = &cfg
+	return nil
 }
 
-// Default returns the default store
+// Default returns the default store, building it on first use
 func Default() *Store {
-	if defaultStore == nil {
-		Init(DefaultConfig())
-	}
+	once.Do(func() {
+		cfg := DefaultConfig()
+		if defaultCfg != nil {
+			cfg = *defaultCfg
+		}
+		store, err := NewStore(cfg)
+		if err != nil {
+			// Fall back to a disabled store so Record* calls stay no-ops
+			store = &Store{enabled: false}
+		}
+		defaultStore = store
+	})
 	return defaultStore
 }
 
@@ -0,0 +1,244 @@
+// Package waybar patches the user's Waybar config for the wizado module.
+// It is shared by setup (install/update the module) and remove (strip it
+// back out) so the JSONC handling lives in exactly one place.
+package waybar
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"os"
+	"os/exec"
+	"path/filepath"
+)
+
+// moduleName is the key wizado installs into the Waybar config
+const moduleName = "custom/wizado"
+
+// ModuleJSON is the module definition as JSON, printed as manual-install
+// instructions when the config cannot be edited automatically.
+const ModuleJSON = `{
+    "custom/wizado": {
+        "format": "{}",
+        "return-type": "json",
+        "exec": "wizado status",
+        "on-click": "wizado-menu-float",
+        "on-click-right": "wizado-menu-float",
+        "interval": 60,
+        "tooltip": true
+    }
+}`
+
+// moduleDefinition returns the wizado module block.
+// on-click uses wizado-menu-float to spawn a terminal for the TUI.
+func moduleDefinition() map[string]interface{} {
+	return map[string]interface{}{
+		"format":         "{}",
+		"return-type":    "json",
+		"exec":           "wizado status",
+		"on-click":       "wizado-menu-float",
+		"on-click-right": "wizado-menu-float",
+		"interval":       60,
+		"tooltip":        true,
+	}
+}
+
+// FindConfig locates the user's waybar config file. Callers resolve
+// the home directory once and pass it in.
+func FindConfig(home string) (string, error) {
+	waybarDir := filepath.Join(home, ".config", "waybar")
+
+	configPath := filepath.Join(waybarDir, "config.jsonc")
+	if _, err := os.Stat(configPath); os.IsNotExist(err) {
+		configPath = filepath.Join(waybarDir, "config")
+		if _, err := os.Stat(configPath); os.IsNotExist(err) {
+			return "", fmt.Errorf("waybar config not found")
+		}
+	}
+
+	return configPath, nil
+}
+
+// Configure adds or updates the wizado module in the waybar config.
+// Reports whether the module was already present and whether the
+// config file was actually modified.
+func Configure(configPath string) (existed, changed bool, err error) {
+	data, err := os.ReadFile(configPath)
+	if err != nil {
+		return false, false, err
+	}
+
+	moduleExists := bytes.Contains(data, []byte(`"`+moduleName+`"`))
+
+	var config map[string]interface{}
+	if err := json.Unmarshal(stripJSONC(data), &config); err != nil {
+		return moduleExists, false, err
+	}
+
+	if groupKey, _ := findModuleGroup(config, moduleName); groupKey != "" {
+		// Bar entry present - skip the rewrite, and the waybar restart
+		// it forces on the caller, when the existing definition already
+		// matches what we would write.
+		if existing, ok := config[moduleName]; ok && sameJSON(existing, moduleDefinition()) {
+			return true, false, nil
+		}
+	} else {
+		// Add new module to modules-right first. Shift in place rather
+		// than allocating a fresh slice just to prepend one element.
+		if modules, ok := config["modules-right"].([]interface{}); ok {
+			modules = append(modules, nil)
+			copy(modules[1:], modules)
+			modules[0] = moduleName
+			config["modules-right"] = modules
+		}
+	}
+
+	// Always set/update the module definition with correct values
+	config[moduleName] = moduleDefinition()
+
+	return moduleExists, true, writeConfig(configPath, config)
+}
+
+// sameJSON reports whether two values serialize to identical JSON.
+// Lets the parsed module block (where numbers decode as float64) be
+// compared against the desired definition without caring about Go
+// types; encoding/json sorts map keys, so the output is canonical.
+func sameJSON(a, b interface{}) bool {
+	aj, err := json.Marshal(a)
+	if err != nil {
+		return false
+	}
+	bj, err := json.Marshal(b)
+	if err != nil {
+		return false
+	}
+	return bytes.Equal(aj, bj)
+}
+
+// Remove deletes the wizado module definition and its bar entries
+// from the waybar config. Reports whether anything was removed.
+func Remove(configPath string) (bool, error) {
+	data, err := os.ReadFile(configPath)
+	if err != nil {
+		return false, err
+	}
+
+	if !bytes.Contains(data, []byte(`"`+moduleName+`"`)) {
+		return false, nil
+	}
+
+	var config map[string]interface{}
+	if err := json.Unmarshal(stripJSONC(data), &config); err != nil {
+		return false, err
+	}
+
+	delete(config, moduleName)
+
+	// Drop bar entries from every module group in one sweep, filtering
+	// in place - the kept elements are compacted into each slice's own
+	// backing array, and duplicate entries are caught too. The config
+	// is still serialized and written exactly once below.
+	for _, key := range moduleGroupKeys {
+		modules, ok := config[key].([]interface{})
+		if !ok {
+			continue
+		}
+		kept := modules[:0]
+		for _, m := range modules {
+			if m != moduleName {
+				kept = append(kept, m)
+			}
+		}
+		config[key] = kept
+	}
+
+	return true, writeConfig(configPath, config)
+}
+
+// moduleGroupKeys lists the waybar arrays a module entry can appear in
+var moduleGroupKeys = []string{"modules-left", "modules-center", "modules-right"}
+
+// findModuleGroup returns the modules-* key and index where name
+// appears in the bar layout. Each group is resolved with a single
+// lookup and scanned once, rather than a membership test followed by
+// a second search for the index. Returns ("", -1) when absent.
+func findModuleGroup(config map[string]interface{}, name string) (string, int) {
+	for _, key := range moduleGroupKeys {
+		modules, ok := config[key].([]interface{})
+		if !ok {
+			continue
+		}
+		for i, m := range modules {
+			if m == name {
+				return key, i
+			}
+		}
+	}
+	return "", -1
+}
+
+// Restart restarts waybar so config changes take effect
+func Restart() {
+	exec.Command("pkill", "waybar").Run()
+	exec.Command("waybar").Start()
+}
+
+func writeConfig(configPath string, config map[string]interface{}) error {
+	f, err := os.OpenFile(configPath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
+	if err != nil {
+		return err
+	}
+
+	// Encode straight into the file rather than building the whole
+	// document in memory with MarshalIndent and copying it out again.
+	enc := json.NewEncoder(f)
+	enc.SetIndent("", "  ")
+	// Keep pango markup in waybar format strings readable instead of
+	// <span> escapes (also skips the HTML-escaping pass)
+	enc.SetEscapeHTML(false)
+
+	err = enc.Encode(config)
+	if cerr := f.Close(); err == nil {
+		err = cerr
+	}
+	return err
+}
+
+// stripJSONC removes // line comments from JSONC input in a single pass.
+// A regex like (?m)//.*$ would also strip "//" occurring inside JSON
+// strings (e.g. URLs in on-click commands), so track string state and
+// use IndexByte for the bulk skip to the next newline. Operates on
+// bytes so the result can be handed straight to json.Unmarshal.
+func stripJSONC(raw []byte) []byte {
+	var out []byte
+	inString := false
+	start := 0
+	for i := 0; i < len(raw); i++ {
+		c := raw[i]
+		switch {
+		case inString:
+			if c == '\\' {
+				i++ // skip the escaped character
+			} else if c == '"' {
+				inString = false
+			}
+		case c == '"':
+			inString = true
+		case c == '/' && i+1 < len(raw) && raw[i+1] == '/':
+			if out == nil {
+				out = make([]byte, 0, len(raw))
+			}
+			out = append(out, raw[start:i]...)
+			nl := bytes.IndexByte(raw[i:], '\n')
+			if nl == -1 {
+				return out // comment runs to end of input
+			}
+			i += nl // keep the newline so line numbers survive
+			start = i
+		}
+	}
+	if out == nil {
+		return raw // no comments found
+	}
+	return append(out, raw[start:]...)
+}